@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 """Módulo principal do projeto."""
 
+import orjson
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import hashlib
 import logging
+import os
+import tempfile
+import warnings
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+
+# Substituído por numba.prange quando os kernels são compilados
+prange = range
 
 # Configuração de logging
 logging.basicConfig(
@@ -15,36 +31,653 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Módulos de gráficos, importados apenas na primeira visualização
+_plt = None
+_sns = None
+
+# Kernels compilados pelo Numba, criados apenas no primeiro uso
+# (None: ainda não compilados; (): Numba indisponível)
+_kernels = None
+
+# Proporção máxima de valores únicos para converter texto em 'category'
+CATEGORY_RATIO_THRESHOLD = 0.5
+
+# Número de linhas lidas por vez na análise em blocos
+CHUNK_SIZE = 2 ** 18
+
+# Resolução dos gráficos salvos
+PLOT_DPI = 150
+
+# Número de intervalos dos histogramas
+HIST_BINS = 30
+
+# Subdiretório (ao lado do arquivo de dados) onde ficam as cópias em Parquet
+CACHE_DIR = "cache"
+
+# Versão do formato do cache; incrementar quando a leitura do CSV mudar os tipos
+CACHE_VERSION = 4
+
+# Erros que indicam um arquivo de cache ilegível (ex.: truncado)
+CACHE_READ_ERRORS = (OSError, ImportError) + ((pa.ArrowInvalid,) if pa is not None else ())
+
+# Erros que impedem a gravação do cache (ex.: disco cheio, tipos que o Parquet
+# não representa); o cache é só uma otimização, então a leitura segue sem ele
+CACHE_WRITE_ERRORS = (OSError, ImportError, ValueError) + (
+    (pa.ArrowException,) if pa is not None else ()
+)
+
+# Tipos conhecidos das colunas do CSV de exemplo, para evitar a inferência.
+# Sem perda de precisão: reduzir tipos é papel da opção ``diet``.
+CSV_COLUMN_TYPES = {
+    'id': pa.int32(),
+    'categoria': pa.dictionary(pa.int32(), pa.string()),
+    'valor': pa.float64(),
+    'ativo': pa.bool_(),
+} if pa is not None else {}
+
+
+def _downcast_column(series: pd.Series) -> pd.Series:
+    """Converte uma coluna para o menor tipo de dado que comporta seus valores.
+    
+    Args:
+        series (pd.Series): Coluna a ser convertida.
+    
+    Returns:
+        pd.Series: Coluna com tipo reduzido (ou a própria coluna, se não houver ganho).
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    if pd.api.types.is_float_dtype(series):
+        return pd.to_numeric(series, downcast='float')
+    if pd.api.types.is_object_dtype(series) and len(series) > 0:
+        if series.nunique() / len(series) < CATEGORY_RATIO_THRESHOLD:
+            return series.astype('category')
+    return series
+
+
+def _plotting_modules():
+    """Importa matplotlib e seaborn sob demanda.
+    
+    Evita o custo de importação das bibliotecas de gráficos para quem usa
+    apenas a análise.
+    
+    Returns:
+        tuple: Módulos ``matplotlib.pyplot`` e ``seaborn``.
+    """
+    global _plt, _sns
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Gera os gráficos em arquivo, sem janela interativa
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        _plt, _sns = plt, sns
+    return _plt, _sns
+
+
+def _count_nulls(series: pd.Series) -> int:
+    """Conta os valores ausentes de uma coluna sem criar uma máscara do DataFrame.
+    
+    Colunas Arrow já guardam a contagem de nulos; colunas NumPy inteiras ou
+    booleanas não podem ter nulos; nas demais, a máscara é criada apenas para
+    a própria coluna.
+    
+    Args:
+        series (pd.Series): Coluna a ser verificada.
+    
+    Returns:
+        int: Quantidade de valores ausentes.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return int(series.array.__arrow_array__().null_count)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return int(np.count_nonzero(series.cat.codes.to_numpy() == -1))
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in 'iub':
+            return 0
+        values = series.to_numpy()
+        if dtype.kind == 'f':
+            return int(np.count_nonzero(np.isnan(values)))
+        if dtype.kind in 'mM':
+            return int(np.count_nonzero(np.isnat(values)))
+        return int(np.count_nonzero(pd.isna(values)))
+    return int(series.isna().sum())
+
+
+def _column_moments(values: np.ndarray) -> np.ndarray:
+    """Calcula contagem, momentos deslocados, mínimo e máximo por coluna.
+    
+    Todas as estatísticas são obtidas em uma única passagem sobre cada coluna,
+    ignorando valores NaN. Soma e soma dos quadrados são acumuladas em relação
+    ao primeiro valor finito da coluna (``shift``), o que evita o cancelamento
+    numérico quando a média é grande em relação à dispersão.
+    
+    Args:
+        values (np.ndarray): Matriz float64 (linhas x colunas).
+    
+    Returns:
+        np.ndarray: Matriz 6 x colunas com count, sum(x - shift),
+        sum((x - shift)²), min, max e shift.
+    """
+    n_rows, n_cols = values.shape
+    out = np.empty((6, n_cols))
+    for i in prange(n_cols):
+        shift = 0.0
+        for j in range(n_rows):
+            if np.isfinite(values[j, i]):
+                shift = values[j, i]
+                break
+        count = 0
+        total = 0.0
+        total_sq = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        for j in range(n_rows):
+            v = values[j, i]
+            if not np.isnan(v):
+                d = v - shift
+                count += 1
+                total += d
+                total_sq += d * d
+                minimum = min(minimum, v)
+                maximum = max(maximum, v)
+        out[0, i] = count
+        out[1, i] = total
+        out[2, i] = total_sq
+        out[3, i] = minimum
+        out[4, i] = maximum
+        out[5, i] = shift
+    return out
+
+
+def _column_histograms(
+    values: np.ndarray, n_bins: int, lower: np.ndarray, upper: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calcula histogramas de intervalos uniformes para cada coluna.
+    
+    Segue as regras de ``np.histogram`` com ``bins=n_bins``: os limites vão
+    do mínimo ao máximo da coluna e o último intervalo inclui o limite
+    superior. Valores NaN e infinitos são ignorados, tanto nos limites quanto
+    nas contagens.
+    
+    O mínimo e o máximo já calculados por ``_column_moments`` são passados em
+    ``lower`` e ``upper``; só as colunas em que eles não são finitos (ausentes,
+    infinitos ou colunas vazias) são percorridas para encontrar os limites.
+    Valores fora de ``[lower, upper]`` são ignorados, como em
+    ``np.histogram(..., range=(lower, upper))``.
+    
+    Args:
+        values (np.ndarray): Matriz float64 (linhas x colunas).
+        n_bins (int): Número de intervalos.
+        lower (np.ndarray): Mínimo de cada coluna (NaN se desconhecido).
+        upper (np.ndarray): Máximo de cada coluna (NaN se desconhecido).
+    
+    Returns:
+        tuple: Contagens (intervalos x colunas) e limites (intervalos + 1 x colunas).
+    """
+    n_rows, n_cols = values.shape
+    counts = np.zeros((n_bins, n_cols), dtype=np.int64)
+    edges = np.empty((n_bins + 1, n_cols))
+    for i in prange(n_cols):
+        first = lower[i]
+        last = upper[i]
+        if not (np.isfinite(first) and np.isfinite(last)):
+            first = np.inf
+            last = -np.inf
+            for j in range(n_rows):
+                v = values[j, i]
+                if np.isfinite(v):
+                    first = min(first, v)
+                    last = max(last, v)
+        # Mesmos limites padrão de np.histogram para colunas vazias ou constantes
+        if first > last:
+            first = 0.0
+            last = 1.0
+        elif first == last:
+            first -= 0.5
+            last += 0.5
+        
+        step = (last - first) / n_bins
+        for k in range(n_bins):
+            edges[k, i] = k * step + first
+        edges[n_bins, i] = last
+        
+        denom = last - first
+        for j in range(n_rows):
+            v = values[j, i]
+            if not (first <= v <= last):
+                continue
+            k = int((v - first) / denom * n_bins)
+            if k == n_bins:
+                k -= 1
+            if v < edges[k, i]:
+                k -= 1
+            elif k != n_bins - 1 and v >= edges[k + 1, i]:
+                k += 1
+            counts[k, i] += 1
+    return counts, edges
+
+
+def _finite_histogram(values: np.ndarray, n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Calcula o histograma de uma coluna com ``np.histogram``, sem o Numba.
+    
+    Ignora valores NaN e infinitos, como ``_column_histograms``.
+    
+    Args:
+        values (np.ndarray): Valores float64 da coluna.
+        n_bins (int): Número de intervalos.
+    
+    Returns:
+        tuple: Contagens e limites dos intervalos.
+    """
+    return np.histogram(values[np.isfinite(values)], bins=n_bins)
+
+
+def _compiled_kernels() -> Optional[Tuple[Callable, Callable]]:
+    """Compila ``_column_moments`` e ``_column_histograms`` com o Numba sob demanda.
+    
+    Evita o custo de importação do Numba para quem não chega a calcular o
+    resumo numérico nem os histogramas.
+    
+    Returns:
+        tuple: Versões compiladas de ``_column_moments`` e ``_column_histograms``,
+        ou None se o Numba não estiver instalado.
+    """
+    global _kernels, prange
+    if _kernels is None:
+        try:
+            import numba
+        except ImportError:  # pragma: no cover - dependência opcional
+            _kernels = ()
+        else:
+            # Os kernels usam o nome global 'prange', resolvido na compilação
+            prange = numba.prange
+            # fastmath sem 'nnan' (a verificação de NaN precisa ser preservada) e sem
+            # 'reassoc' (reordenar as somas desfaria o deslocamento dos momentos)
+            moments = numba.njit(
+                parallel=True,
+                fastmath={'nsz', 'arcp', 'contract', 'afn'},
+                cache=True,
+            )(_column_moments)
+            histograms = numba.njit(parallel=True, cache=True)(_column_histograms)
+            _kernels = (moments, histograms)
+    return _kernels or None
+
+
+def _json_default(value: Any) -> Any:
+    """Converte para JSON os tipos do pandas que o orjson não reconhece.
+    
+    Args:
+        value (Any): Valor não serializável pelo orjson.
+    
+    Returns:
+        Any: Representação serializável do valor.
+    
+    Raises:
+        TypeError: Se o tipo não for suportado.
+    """
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+
+
+@dataclass(eq=False)
+class AnalysisResult(Mapping):
+    """Resultados da análise exploratória.
+    
+    Os resumos são mantidos como objetos pandas e só são convertidos na
+    serialização (``to_json``). O acesso por chave (``result['shape']``)
+    continua disponível e devolve os resumos como dicionários.
+    
+    Attributes:
+        shape (tuple): Número de linhas e colunas.
+        columns (list): Nomes das colunas.
+        dtypes (dict): Nome do tipo de cada coluna.
+        missing_values (dict): Quantidade de valores ausentes por coluna.
+        numeric_summary (pd.DataFrame): Estatísticas descritivas (estatística x coluna).
+        categorical_summary (dict): Série de contagens por coluna categórica.
+    """
+    
+    shape: Tuple[int, int]
+    columns: List[str]
+    dtypes: Dict[str, str]
+    missing_values: Dict[str, int]
+    numeric_summary: pd.DataFrame
+    categorical_summary: Dict[str, pd.Series]
+    
+    def __getitem__(self, key: str) -> Any:
+        if key == 'numeric_summary':
+            return self.numeric_summary.to_dict()
+        if key == 'categorical_summary':
+            return {col: counts.to_dict() for col, counts in self.categorical_summary.items()}
+        if key in self._keys():
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+    
+    def __len__(self) -> int:
+        return len(self._keys())
+    
+    @classmethod
+    def _keys(cls) -> Tuple[str, ...]:
+        return tuple(field.name for field in fields(cls))
+    
+    def to_json(self) -> bytes:
+        """Serializa os resultados em JSON com orjson.
+        
+        Returns:
+            bytes: Documento JSON codificado em UTF-8.
+        """
+        summary = self.numeric_summary
+        payload = {
+            'shape': self.shape,
+            'columns': self.columns,
+            'dtypes': self.dtypes,
+            'missing_values': self.missing_values,
+            'numeric_summary': {
+                col: dict(zip(summary.index, summary[col].to_numpy()))
+                for col in summary.columns
+            },
+            'categorical_summary': {
+                col: dict(zip(counts.index.tolist(), counts.to_numpy()))
+                for col, counts in self.categorical_summary.items()
+            },
+        }
+        return orjson.dumps(
+            payload,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+class _ChunkAccumulator:
+    """Acumula estatísticas de dados lidos em blocos, sem mantê-los em memória."""
+    
+    def __init__(self):
+        """Inicializa os acumuladores vazios."""
+        self.n_rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.missing = pd.Series(dtype=np.int64)
+        self.count = pd.Series(dtype=np.float64)
+        self.mean = pd.Series(dtype=np.float64)
+        self.m2 = pd.Series(dtype=np.float64)
+        self.minimum = pd.Series(dtype=np.float64)
+        self.maximum = pd.Series(dtype=np.float64)
+        self.value_counts = {}
+    
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Incorpora um bloco de dados às estatísticas acumuladas.
+        
+        Args:
+            chunk (pd.DataFrame): Bloco de dados lido do arquivo.
+        """
+        self.n_rows += len(chunk)
+        self.columns.extend(col for col in chunk.columns if col not in self.columns)
+        for col, dtype in zip(chunk.columns, chunk.dtypes.astype(str)):
+            self.dtypes.setdefault(col, dtype)
+        self.missing = self.missing.add(chunk.isnull().sum(), fill_value=0)
+        
+        numeric = chunk.select_dtypes(include=[np.number]).astype(np.float64)
+        self._merge_moments(numeric)
+        self.minimum = pd.concat([self.minimum, numeric.min()], axis=1).min(axis=1)
+        self.maximum = pd.concat([self.maximum, numeric.max()], axis=1).max(axis=1)
+        
+        for col in chunk.select_dtypes(include=['object', 'category']).columns:
+            counts = chunk[col].value_counts()
+            if col in self.value_counts:
+                counts = self.value_counts[col].add(counts, fill_value=0)
+            self.value_counts[col] = counts
+    
+    def _merge_moments(self, numeric: pd.DataFrame) -> None:
+        """Combina contagem, média e M2 do bloco com os valores acumulados.
+        
+        Usa a atualização em pares de Chan et al., em vez de somar quadrados
+        brutos, para não perder precisão quando a média é grande em relação
+        à dispersão.
+        
+        Args:
+            numeric (pd.DataFrame): Colunas numéricas do bloco, em float64.
+        """
+        chunk_count = numeric.count()
+        chunk_mean = numeric.mean()
+        chunk_m2 = ((numeric - chunk_mean) ** 2).sum()
+        
+        index = self.count.index.union(chunk_count.index, sort=False)
+        count_a = self.count.reindex(index, fill_value=0)
+        mean_a = self.mean.reindex(index, fill_value=0)
+        m2_a = self.m2.reindex(index, fill_value=0)
+        count_b = chunk_count.reindex(index, fill_value=0)
+        mean_b = chunk_mean.reindex(index).fillna(0)
+        m2_b = chunk_m2.reindex(index, fill_value=0)
+        
+        count = count_a + count_b
+        delta = mean_b - mean_a
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = (count_b / count).fillna(0)
+        self.mean = mean_a + delta * weight
+        self.m2 = m2_a + m2_b + delta ** 2 * count_a * weight
+        self.count = count
+    
+    def finalize(self) -> AnalysisResult:
+        """Calcula as estatísticas finais a partir dos momentos acumulados.
+        
+        Os tipos são os do primeiro bloco em que cada coluna aparece, e o
+        resumo numérico não inclui percentis.
+        
+        Returns:
+            AnalysisResult: Resultados da análise, como em ``DataAnalyzer.analyze``.
+        """
+        mean = self.mean.where(self.count > 0)
+        # Com menos de dois valores o desvio é indefinido (NaN), como no pandas
+        variance = (self.m2 / (self.count - 1)).where(self.count > 1)
+        numeric_summary = pd.DataFrame({
+            'count': self.count,
+            'mean': mean,
+            'std': np.sqrt(variance.clip(lower=0)),
+            'min': self.minimum,
+            'max': self.maximum,
+        }).T
+        
+        return AnalysisResult(
+            shape=(self.n_rows, len(self.columns)),
+            columns=list(self.columns),
+            dtypes=dict(self.dtypes),
+            missing_values=self.missing.astype(np.int64).to_dict(),
+            numeric_summary=numeric_summary,
+            categorical_summary={
+                col: counts.astype(np.int64).sort_values(ascending=False)
+                for col, counts in self.value_counts.items()
+            }
+        )
+
 
 class DataAnalyzer:
     """Classe para análise de dados."""
     
-    def __init__(self, data_path: str = "data/sample_data.csv"):
+    def __init__(self, data_path: str = "data/sample_data.csv", diet: bool = False):
         """Inicializa o analisador de dados.
         
         Args:
             data_path (str): Caminho para o arquivo de dados.
+            diet (bool): Se True, reduz os tipos das colunas após o carregamento.
         """
         self.data_path = Path(data_path)
+        self.diet = diet
         self.data = None
+    
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        """pd.DataFrame: Dados em análise (None enquanto não carregados)."""
+        return self._data
+    
+    @data.setter
+    def data(self, value: Optional[pd.DataFrame]) -> None:
+        self._data = value
+        self._refresh_schema()
+    
+    def _refresh_schema(self) -> None:
+        """Atualiza as colunas de cada tipo, reaproveitadas pela análise e pelos gráficos.
         
+        Chamado sempre que ``data`` é reatribuído.
+        """
+        self._value_counts = None
+        self._numeric_ranges = None
+        if self._data is None:
+            self._numeric_cols = self._cat_cols = self._bool_cols = self._date_cols = ()
+            return
+        self._numeric_cols = tuple(self._data.select_dtypes(include=[np.number]).columns)
+        self._cat_cols = tuple(self._data.select_dtypes(include=['object', 'category']).columns)
+        # is_bool_dtype também reconhece booleanos Arrow, ignorados por select_dtypes
+        self._bool_cols = tuple(
+            col for col, dtype in self._data.dtypes.items() if pd.api.types.is_bool_dtype(dtype)
+        )
+        self._date_cols = tuple(self._data.select_dtypes(include=['datetime']).columns)
+    
     def load_data(self) -> pd.DataFrame:
         """Carrega os dados do arquivo.
         
+        Se o arquivo não existir ou não puder ser interpretado como CSV, gera
+        dados de exemplo. Problemas no cache em Parquet são tratados por
+        ``_read_cached``; outros erros de leitura são propagados.
+        
         Returns:
             pd.DataFrame: Dados carregados.
         """
+        if not self.data_path.is_file():
+            logger.warning("Arquivo de dados não encontrado. Gerando dados de exemplo...")
+            return self.generate_sample_data()
+        
         try:
-            if self.data_path.exists():
-                self.data = pd.read_csv(self.data_path)
-                logger.info(f"Dados carregados: {self.data.shape}")
-                return self.data
-            else:
-                logger.warning("Arquivo de dados não encontrado. Gerando dados de exemplo...")
-                return self.generate_sample_data()
-        except Exception as e:
+            data = self._read_cached()
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as e:
             logger.error(f"Erro ao carregar dados: {e}")
             return self.generate_sample_data()
+        
+        self.data = self._downcast(data) if self.diet else data
+        logger.info(f"Dados carregados: {self.data.shape}")
+        return self.data
+    
+    def _cache_path(self) -> Path:
+        """Retorna o caminho da cópia em Parquet do arquivo de dados.
+        
+        O nome do arquivo é o SHA-1 do conteúdo (e de ``CACHE_VERSION``), então
+        qualquer alteração nos dados gera uma nova entrada no cache.
+        
+        Returns:
+            Path: Caminho do arquivo Parquet em cache.
+        """
+        digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+        with open(self.data_path, 'rb') as fh:
+            for block in iter(lambda: fh.read(1 << 20), b''):
+                digest.update(block)
+        return self.data_path.parent / CACHE_DIR / f"{digest.hexdigest()}.parquet"
+    
+    def _read_cached(self) -> pd.DataFrame:
+        """Lê os dados do cache em Parquet, criando-o a partir do CSV se necessário.
+        
+        Returns:
+            pd.DataFrame: Dados lidos.
+        """
+        cache_path = self._cache_path()
+        if cache_path.exists():
+            try:
+                df = pd.read_parquet(cache_path, engine='pyarrow')
+            except CACHE_READ_ERRORS as e:
+                # Entrada corrompida (ex.: gravação interrompida): descarta e relê o CSV
+                logger.warning(f"Cache de dados inválido, recriando: {e}")
+                cache_path.unlink(missing_ok=True)
+            else:
+                logger.info(f"Dados lidos do cache: {cache_path}")
+                return df
+        
+        df = self._read_csv()
+        try:
+            self._write_cache(df, cache_path)
+        except CACHE_WRITE_ERRORS as e:
+            logger.warning(f"Não foi possível gravar o cache de dados: {e}")
+        return df
+    
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+        """Grava o cache em Parquet de forma atômica.
+        
+        Os dados são escritos em um arquivo temporário no mesmo diretório e só
+        então renomeados para ``cache_path``, para que uma gravação interrompida
+        nunca deixe um arquivo truncado com o nome definitivo.
+        
+        Args:
+            df (pd.DataFrame): Dados a serem gravados.
+            cache_path (Path): Caminho final do arquivo de cache.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.parquet.tmp')
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_name, engine='pyarrow', compression='snappy', index=False)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    
+    def _read_csv(self) -> pd.DataFrame:
+        """Lê o arquivo CSV usando o leitor mais rápido disponível.
+        
+        Quando o PyArrow está instalado, a leitura é feita pelo seu parser
+        multi-thread, com os tipos das colunas conhecidas declarados de antemão
+        (veja ``CSV_COLUMN_TYPES``). Se o PyArrow não estiver disponível, os
+        dados não respeitarem esses tipos ou o cabeçalho repetir nomes de
+        colunas, usa ``pd.read_csv``.
+        
+        Returns:
+            pd.DataFrame: Dados lidos do arquivo.
+        """
+        if pa is not None:
+            try:
+                table = pacsv.read_csv(
+                    self.data_path,
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=2 ** 22),
+                    parse_options=pacsv.ParseOptions(delimiter=','),
+                    # Células de texto vazias viram ausentes, como no pd.read_csv
+                    convert_options=pacsv.ConvertOptions(
+                        column_types=CSV_COLUMN_TYPES, strings_can_be_null=True
+                    ),
+                )
+            except pa.ArrowInvalid as e:
+                logger.warning(f"Leitura com PyArrow falhou, usando pandas: {e}")
+            else:
+                # O PyArrow mantém nomes repetidos; o pandas os renomeia (x, x.1)
+                if len(set(table.column_names)) == table.num_columns:
+                    return table.to_pandas(date_as_object=False)
+                logger.warning("Colunas com nomes repetidos, usando pandas")
+        return pd.read_csv(self.data_path)
+    
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Reduz os tipos de todas as colunas em paralelo.
+        
+        Args:
+            df (pd.DataFrame): Dados a serem convertidos.
+        
+        Returns:
+            pd.DataFrame: Dados com tipos reduzidos.
+        """
+        if len(df.columns) == 0:
+            return df
+        
+        before = df.memory_usage(deep=True).sum()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            columns = list(executor.map(_downcast_column, (df[col] for col in df.columns)))
+        df = pd.concat(columns, axis=1)
+        after = df.memory_usage(deep=True).sum()
+        
+        logger.info(f"Tipos reduzidos: {before / 1024:.1f} KB -> {after / 1024:.1f} KB")
+        return df
     
     def generate_sample_data(self) -> pd.DataFrame:
         """Gera dados de exemplo para demonstração.
@@ -52,42 +685,178 @@ class DataAnalyzer:
         Returns:
             pd.DataFrame: Dados de exemplo.
         """
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n_samples = 1000
         
         data = {
-            'id': range(1, n_samples + 1),
-            'categoria': np.random.choice(['A', 'B', 'C', 'D'], n_samples),
-            'valor': np.random.normal(100, 25, n_samples),
-            'data': pd.date_range('2023-01-01', periods=n_samples, freq='D'),
-            'ativo': np.random.choice([True, False], n_samples, p=[0.7, 0.3])
+            'id': np.arange(1, n_samples + 1, dtype=np.int32),
+            'categoria': rng.choice(np.array(['A', 'B', 'C', 'D'], dtype=object), n_samples),
+            'valor': rng.normal(100.0, 25.0, n_samples).astype(np.float32),
+            'data': np.datetime64('2023-01-01') + np.arange(n_samples),
+            'ativo': rng.random(n_samples) < 0.7
         }
+        if pa is not None:
+            # Booleano Arrow: 1 bit por linha em vez de 1 byte
+            data['ativo'] = pd.array(data['ativo'], dtype='bool[pyarrow]')
         
         self.data = pd.DataFrame(data)
         logger.info(f"Dados de exemplo gerados: {self.data.shape}")
         return self.data
     
-    def analyze(self) -> dict:
+    def analyze(self) -> AnalysisResult:
         """Realiza análise exploratória dos dados.
         
         Returns:
-            dict: Resultados da análise.
+            AnalysisResult: Resultados da análise.
         """
         if self.data is None:
             self.load_data()
         
-        analysis = {
-            'shape': self.data.shape,
-            'columns': list(self.data.columns),
-            'dtypes': self.data.dtypes.to_dict(),
-            'missing_values': self.data.isnull().sum().to_dict(),
-            'numeric_summary': self.data.describe().to_dict() if len(self.data.select_dtypes(include=[np.number]).columns) > 0 else {},
-            'categorical_summary': {col: self.data[col].value_counts().to_dict() 
-                                  for col in self.data.select_dtypes(include=['object', 'category']).columns}
-        }
+        analysis = AnalysisResult(
+            shape=self.data.shape,
+            columns=list(self.data.columns),
+            dtypes=dict(zip(self.data.columns, self.data.dtypes.astype(str))),
+            missing_values={col: _count_nulls(self.data[col]) for col in self.data.columns},
+            numeric_summary=self._numeric_summary(),
+            categorical_summary=self._categorical_summary()
+        )
         
         return analysis
     
+    def _numeric_summary(self) -> pd.DataFrame:
+        """Calcula as estatísticas descritivas das colunas numéricas.
+        
+        Com o Numba disponível, contagem, média, desvio padrão, mínimo e máximo
+        são obtidos em uma única passagem compilada (``_column_moments``);
+        caso contrário, usa ``DataFrame.describe``. O mínimo e o máximo ficam
+        guardados para a próxima chamada de ``create_visualizations``, que os
+        consome como limites dos histogramas.
+        
+        Returns:
+            pd.DataFrame: Estatísticas por coluna, no formato de ``describe()``.
+        """
+        self._numeric_ranges = None
+        if not self._numeric_cols:
+            return pd.DataFrame()
+        kernels = _compiled_kernels()
+        if kernels is None or len(self.data) == 0:
+            return self.data.describe()
+        
+        column_moments, _ = kernels
+        values = self._numeric_values(self._numeric_cols)
+        count, total, total_sq, minimum, maximum, shift = column_moments(values)
+        empty = count == 0
+        minimum[empty] = np.nan
+        maximum[empty] = np.nan
+        
+        # Limites guardados para os histogramas da próxima visualização
+        self._numeric_ranges = pd.DataFrame(
+            [minimum, maximum], index=['min', 'max'], columns=list(self._numeric_cols)
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shifted_mean = total / count
+            mean = shift + shifted_mean
+            variance = (total_sq - total * shifted_mean) / (count - 1)
+        std = np.sqrt(np.clip(variance, 0, None))
+        
+        with warnings.catch_warnings():
+            # Colunas só com NaN geram aviso e resultado NaN, como no describe()
+            warnings.simplefilter('ignore', RuntimeWarning)
+            quartiles = np.nanpercentile(values, [25, 50, 75], axis=0)
+        
+        summary = pd.DataFrame(
+            [count, mean, std, minimum, *quartiles, maximum],
+            index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+            columns=list(self._numeric_cols),
+        )
+        
+        # Colunas de data também fazem parte do describe() padrão do pandas
+        if self._date_cols:
+            dates = self.data[list(self._date_cols)].describe()
+            summary = pd.concat([summary, dates], axis=1)
+            summary = summary[[col for col in self.data.columns if col in summary.columns]]
+        
+        return summary
+    
+    def _numeric_values(self, cols: Tuple[str, ...]) -> np.ndarray:
+        """Converte as colunas informadas na matriz de entrada dos kernels compilados.
+        
+        Args:
+            cols (tuple): Colunas numéricas a converter.
+        
+        Returns:
+            np.ndarray: Matriz float64 em ordem de coluna, com NaN nos ausentes.
+        """
+        numeric = self.data[list(cols)]
+        return np.asfortranarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+    
+    def _categorical_summary(self) -> Dict[str, pd.Series]:
+        """Resume as colunas categóricas com contagens calculadas nesta chamada.
+        
+        As contagens (incluindo as das colunas booleanas) ficam guardadas para
+        a próxima chamada de ``create_visualizations``, que as consome.
+        
+        Returns:
+            dict: Série de contagens por coluna, em ordem decrescente.
+        """
+        self._value_counts = self._compute_value_counts()
+        return {col: self._value_counts[col] for col in self._cat_cols}
+    
+    def _compute_value_counts(self) -> dict:
+        """Conta os valores das colunas categóricas e booleanas.
+        
+        ``value_counts`` por coluna usa os códigos das colunas ``category`` e
+        evita empilhar todas as colunas em uma única coluna ``object``.
+        
+        Returns:
+            dict: Série de contagens (em ordem decrescente) por coluna.
+        """
+        return {col: self.data[col].value_counts() for col in self._cat_cols + self._bool_cols}
+    
+    def analyze_chunks(self, chunksize: int = CHUNK_SIZE) -> AnalysisResult:
+        """Analisa o arquivo de dados em blocos, sem carregá-lo inteiro na memória.
+        
+        Permite processar arquivos maiores que a memória disponível. Arquivos
+        ``.parquet`` são lidos em lotes Arrow; os demais, como CSV.
+        
+        Args:
+            chunksize (int): Número de linhas por bloco.
+        
+        Returns:
+            AnalysisResult: Resultados da análise (sem percentis).
+        """
+        accumulator = _ChunkAccumulator()
+        
+        if not self.data_path.is_file():
+            logger.warning("Arquivo de dados não encontrado. Gerando dados de exemplo...")
+            accumulator.update(self.generate_sample_data())
+            return accumulator.finalize()
+        
+        for chunk in self._iter_chunks(chunksize):
+            accumulator.update(chunk)
+        
+        logger.info(f"Dados analisados em blocos: {accumulator.n_rows} linhas")
+        return accumulator.finalize()
+    
+    def _iter_chunks(self, chunksize: int):
+        """Lê o arquivo de dados em blocos de ``chunksize`` linhas.
+        
+        Args:
+            chunksize (int): Número de linhas por bloco.
+        
+        Yields:
+            pd.DataFrame: Próximo bloco de dados.
+        """
+        if self.data_path.suffix == '.parquet':
+            import pyarrow.dataset as ds
+            
+            for batch in ds.dataset(self.data_path).to_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            with pd.read_csv(self.data_path, chunksize=chunksize) as reader:
+                yield from reader
+    
     def create_visualizations(self, save_path: str = "plots/") -> None:
         """Cria visualizações dos dados.
         
@@ -97,6 +866,9 @@ class DataAnalyzer:
         if self.data is None:
             self.load_data()
         
+        from joblib import Parallel, delayed
+        plt, sns = _plotting_modules()
+        
         save_dir = Path(save_path)
         save_dir.mkdir(exist_ok=True)
         
@@ -105,40 +877,70 @@ class DataAnalyzer:
         sns.set_palette("husl")
         
         # Gráfico 1: Distribuição de valores numéricos
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._numeric_cols
         if len(numeric_cols) > 0:
-            fig, axes = plt.subplots(1, len(numeric_cols), figsize=(15, 5))
+            fig, axes = plt.subplots(
+                1, len(numeric_cols), figsize=(15, 5), constrained_layout=True
+            )
             if len(numeric_cols) == 1:
                 axes = [axes]
             
-            for i, col in enumerate(numeric_cols):
-                if col != 'id':  # Pula colunas de ID
-                    self.data[col].hist(bins=30, ax=axes[i])
-                    axes[i].set_title(f'Distribuição de {col}')
-                    axes[i].set_xlabel(col)
-                    axes[i].set_ylabel('Frequência')
+            # Pula colunas de ID; com o Numba, os histogramas saem de um único kernel
+            hist_cols = [(i, col) for i, col in enumerate(numeric_cols) if col != 'id']
+            names = tuple(col for _, col in hist_cols)
+            # Reaproveita o mínimo e o máximo do último analyze() uma única vez
+            ranges = self._numeric_ranges
+            self._numeric_ranges = None
+            kernels = _compiled_kernels()
+            if kernels is not None:
+                _, column_histograms = kernels
+                if ranges is None:
+                    lower = upper = np.full(len(names), np.nan)
+                else:
+                    lower, upper = ranges[list(names)].to_numpy()
+                counts, edges = column_histograms(
+                    self._numeric_values(names), HIST_BINS, lower, upper
+                )
+                hists = [(counts[:, j], edges[:, j]) for j in range(len(hist_cols))]
+            else:
+                values = self._numeric_values(names)
+                hists = Parallel(n_jobs=-1, backend='threading')(
+                    delayed(_finite_histogram)(values[:, j], HIST_BINS)
+                    for j in range(len(names))
+                )
+            
+            for (i, col), (counts, edges) in zip(hist_cols, hists):
+                axes[i].stairs(counts, edges, fill=True, rasterized=True)
+                axes[i].set_title(f'Distribuição de {col}')
+                axes[i].set_xlabel(col)
+                axes[i].set_ylabel('Frequência')
             
-            plt.tight_layout()
-            plt.savefig(save_dir / 'distribuicoes.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(save_dir / 'distribuicoes.png', dpi=PLOT_DPI)
+            plt.close(fig)
         
         # Gráfico 2: Variáveis categóricas
-        categorical_cols = self.data.select_dtypes(include=['object', 'category', 'bool']).columns
+        categorical_cols = self._cat_cols + self._bool_cols
+        # Reaproveita as contagens do último analyze() uma única vez
+        value_counts = self._value_counts
+        self._value_counts = None
+        if value_counts is None:
+            value_counts = self._compute_value_counts()
         if len(categorical_cols) > 0:
-            fig, axes = plt.subplots(1, len(categorical_cols), figsize=(15, 5))
+            fig, axes = plt.subplots(
+                1, len(categorical_cols), figsize=(15, 5), constrained_layout=True
+            )
             if len(categorical_cols) == 1:
                 axes = [axes]
             
             for i, col in enumerate(categorical_cols):
-                self.data[col].value_counts().plot(kind='bar', ax=axes[i])
+                value_counts[col].plot(kind='bar', ax=axes[i])
                 axes[i].set_title(f'Contagem de {col}')
                 axes[i].set_xlabel(col)
                 axes[i].set_ylabel('Contagem')
                 axes[i].tick_params(axis='x', rotation=45)
             
-            plt.tight_layout()
-            plt.savefig(save_dir / 'categoricas.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.savefig(save_dir / 'categoricas.png', dpi=PLOT_DPI)
+            plt.close(fig)
         
         logger.info(f"Visualizações salvas em {save_dir}")
 
@@ -156,9 +958,7 @@ def main():
     
     # Exibe resultados
     print("\n=== RESULTADO DA ANÁLISE ===")
-    print(f"Formato dos dados: {analysis_results['shape']}")
-    print(f"Colunas: {analysis_results['columns']}")
-    print(f"Valores ausentes: {analysis_results['missing_values']}")
+    print(analysis_results.to_json().decode())
     
     # Cria visualizações
     analyzer.create_visualizations()
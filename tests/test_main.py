@@ -5,13 +5,14 @@ import pytest
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import subprocess
 import sys
 import os
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from main import DataAnalyzer
+from main import AnalysisResult, DataAnalyzer
 
 
 class TestDataAnalyzer:
@@ -43,10 +44,11 @@ class TestDataAnalyzer:
         assert list(data.columns) == expected_columns
         
         # Verifica os tipos de dados
-        assert data['id'].dtype == 'int64'
+        assert data['id'].dtype == 'int32'
         assert data['categoria'].dtype == 'object'
-        assert data['valor'].dtype == 'float64'
-        assert data['ativo'].dtype == 'bool'
+        assert data['valor'].dtype == 'float32'
+        assert pd.api.types.is_datetime64_any_dtype(data['data'])
+        assert data['ativo'].dtype == 'bool[pyarrow]'
     
     def test_load_data_without_file(self):
         """Testa o carregamento de dados quando o arquivo não existe."""
@@ -59,6 +61,154 @@ class TestDataAnalyzer:
         assert isinstance(data, pd.DataFrame)
         assert data.shape[0] == 1000
     
+    def test_load_data_invalid_file(self, tmp_path):
+        """Testa o carregamento de um arquivo que não pode ser lido como CSV."""
+        csv_path = tmp_path / "vazio.csv"
+        csv_path.write_text("")
+        self.analyzer.data_path = csv_path
+        
+        data = self.analyzer.load_data()
+        
+        # Deve gerar dados de exemplo
+        assert data.shape[0] == 1000
+    
+    def test_load_data_from_csv(self):
+        """Testa o carregamento de dados a partir do CSV de exemplo."""
+        self.analyzer.data_path = Path(__file__).parent.parent / "data" / "sample_data.csv"
+        
+        data = self.analyzer.load_data()
+        
+        # A interface pública continua retornando um DataFrame pandas
+        assert isinstance(data, pd.DataFrame)
+        assert list(data.columns) == ['id', 'categoria', 'valor', 'data', 'ativo']
+        assert data.shape[0] == 20
+        
+        # Tipos declarados para as colunas conhecidas
+        assert data['id'].dtype == 'int32'
+        assert data['categoria'].dtype == 'category'
+        assert data['valor'].dtype == 'float64'
+        assert pd.api.types.is_datetime64_any_dtype(data['data'])
+    
+    def test_load_data_keeps_float_precision(self, tmp_path):
+        """Testa se colunas declaradas não perdem precisão na leitura."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("id,valor\n1,12345678.91\n2,0.07\n")
+        
+        data = DataAnalyzer(str(csv_path)).load_data()
+        
+        assert list(data['valor']) == [12345678.91, 0.07]
+    
+    def test_load_data_empty_text_cells(self, tmp_path):
+        """Testa se células de texto vazias são lidas como valores ausentes."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("id,categoria,nome,valor\n1,A,x,1.0\n2,,,2.0\n3,B,y,\n")
+        analyzer = DataAnalyzer(str(csv_path))
+        analyzer.load_data()
+        
+        analysis = analyzer.analyze()
+        
+        assert analysis['missing_values'] == pd.read_csv(csv_path).isnull().sum().to_dict()
+        assert set(analysis['categorical_summary']['categoria']) == {'A', 'B'}
+    
+    def test_load_data_unexpected_types(self, tmp_path):
+        """Testa o carregamento de um CSV que não segue os tipos declarados."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("id,valor\nx1,1.5\nx2,2.5\n")
+        
+        data = DataAnalyzer(str(csv_path)).load_data()
+        
+        assert list(data['id']) == ['x1', 'x2']
+        assert data['valor'].sum() == pytest.approx(4.0)
+    
+    def test_load_data_duplicate_columns(self, tmp_path):
+        """Testa o carregamento de um CSV com nomes de colunas repetidos."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("x,x\n1,2\n3,4\n")
+        
+        data = DataAnalyzer(str(csv_path)).load_data()
+        
+        pd.testing.assert_frame_equal(data, pd.read_csv(csv_path))
+    
+    def test_load_data_parquet_cache(self, tmp_path):
+        """Testa a criação e o reaproveitamento do cache em Parquet."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_bytes(
+            (Path(__file__).parent.parent / "data" / "sample_data.csv").read_bytes()
+        )
+        analyzer = DataAnalyzer(str(csv_path))
+        
+        first = analyzer.load_data()
+        cached = list((tmp_path / "cache").glob("*.parquet"))
+        assert len(cached) == 1
+        
+        second = DataAnalyzer(str(csv_path)).load_data()
+        pd.testing.assert_frame_equal(first, second)
+        
+        # Nenhum arquivo temporário fica para trás
+        assert not list((tmp_path / "cache").glob("*.tmp"))
+        
+        # Alterar o CSV invalida o cache
+        csv_path.write_text(csv_path.read_text() + "21,A,100.0,2023-01-21,True\n")
+        assert DataAnalyzer(str(csv_path)).load_data().shape[0] == 21
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 2
+    
+    def test_load_data_truncated_cache(self, tmp_path):
+        """Testa a recuperação de um cache em Parquet truncado."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_bytes(
+            (Path(__file__).parent.parent / "data" / "sample_data.csv").read_bytes()
+        )
+        expected = DataAnalyzer(str(csv_path)).load_data()
+        cache_file = next((tmp_path / "cache").glob("*.parquet"))
+        cache_file.write_bytes(cache_file.read_bytes()[:100])
+        
+        data = DataAnalyzer(str(csv_path)).load_data()
+        
+        pd.testing.assert_frame_equal(data, expected)
+        # A entrada corrompida é substituída por uma válida
+        pd.testing.assert_frame_equal(pd.read_parquet(cache_file), expected)
+    
+    def test_load_data_invalid_cache_entry(self, tmp_path):
+        """Testa se um cache ilegível não interrompe o carregamento."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("id,valor\n1,1.5\n2,2.5\n")
+        analyzer = DataAnalyzer(str(csv_path))
+        cache_path = analyzer._cache_path()
+        cache_path.parent.mkdir()
+        cache_path.write_bytes(b"isto nao e um arquivo parquet")
+        
+        data = analyzer.load_data()
+        
+        # Os dados vêm do CSV, não da geração de exemplo
+        assert data.shape == (2, 2)
+        assert data['valor'].sum() == pytest.approx(4.0)
+    
+    def test_load_data_cache_write_failure(self, tmp_path, monkeypatch):
+        """Testa se uma falha ao gravar o cache não interrompe o carregamento."""
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("x\n1\na\n")
+        analyzer = DataAnalyzer(str(csv_path))
+        # Coluna object com tipos mistos, que o Parquet não consegue gravar
+        monkeypatch.setattr(analyzer, '_read_csv', lambda: pd.DataFrame({'x': [1, 'a']}))
+        
+        data = analyzer.load_data()
+        
+        assert list(data['x']) == [1, 'a']
+        assert not list((tmp_path / "cache").glob("*"))
+    
+    def test_load_data_diet(self):
+        """Testa a redução de tipos após o carregamento."""
+        analyzer = DataAnalyzer(
+            Path(__file__).parent.parent / "data" / "sample_data.csv", diet=True
+        )
+        
+        data = analyzer.load_data()
+        
+        assert data['id'].dtype == 'int8'
+        assert data['valor'].dtype == 'float32'
+        assert data['categoria'].dtype == 'category'
+        assert data['ativo'].dtype == 'bool'
+    
     def test_analyze(self):
         """Testa a função de análise."""
         # Gera dados de exemplo primeiro
@@ -66,8 +216,9 @@ class TestDataAnalyzer:
         
         analysis = self.analyzer.analyze()
         
-        # Verifica se é um dicionário
-        assert isinstance(analysis, dict)
+        # Verifica o tipo do resultado, que também aceita acesso por chave
+        assert isinstance(analysis, AnalysisResult)
+        assert isinstance(analysis.numeric_summary, pd.DataFrame)
         
         # Verifica as chaves esperadas
         expected_keys = ['shape', 'columns', 'dtypes', 'missing_values', 
@@ -77,7 +228,182 @@ class TestDataAnalyzer:
         # Verifica alguns valores
         assert analysis['shape'] == (1000, 5)
         assert len(analysis['columns']) == 5
+        assert analysis['dtypes']['id'] == 'int32'
+        assert analysis['dtypes']['valor'] == 'float32'
         assert 'categoria' in analysis['categorical_summary']
+        assert analysis['categorical_summary']['categoria'] == \
+            self.analyzer.data['categoria'].value_counts().to_dict()
+    
+    def test_analysis_to_json(self):
+        """Testa a serialização dos resultados em JSON."""
+        import orjson
+        
+        self.analyzer.generate_sample_data()
+        analysis = self.analyzer.analyze()
+        
+        payload = orjson.loads(analysis.to_json())
+        
+        assert payload['shape'] == [1000, 5]
+        assert payload['columns'] == analysis['columns']
+        assert payload['missing_values'] == analysis['missing_values']
+        assert payload['categorical_summary'] == analysis['categorical_summary']
+        assert payload['numeric_summary']['valor']['mean'] == \
+            pytest.approx(analysis['numeric_summary']['valor']['mean'])
+        assert payload['numeric_summary']['data']['min'].startswith('2023-01-01')
+    
+    def test_numeric_summary_matches_describe(self):
+        """Testa se o resumo numérico equivale ao ``describe`` do pandas."""
+        data = self.analyzer.generate_sample_data()
+        data.loc[::10, 'valor'] = np.nan
+        
+        summary = self.analyzer.analyze()['numeric_summary']
+        expected = data.describe().to_dict()
+        
+        assert list(summary) == list(expected)
+        for col in ['id', 'valor']:
+            assert summary[col] == pytest.approx(expected[col])
+        assert summary['data']['min'] == expected['data']['min']
+        
+        # Média grande em relação à dispersão não pode perder precisão no desvio
+        rng = np.random.default_rng(0)
+        self.analyzer.data = pd.DataFrame({'x': 1e9 + rng.normal(0, 1, 100_000)})
+        
+        summary = self.analyzer.analyze()['numeric_summary']
+        expected = self.analyzer.data.describe().to_dict()
+        
+        assert summary['x'] == pytest.approx(expected['x'], rel=1e-9)
+    
+    def test_missing_values(self):
+        """Testa a contagem de valores ausentes para diferentes tipos de coluna."""
+        self.analyzer.data = pd.DataFrame({
+            'inteiro': [1, 2, 3],
+            'real': [1.0, np.nan, np.nan],
+            'texto': ['a', None, 'c'],
+            'categoria': pd.Categorical(['a', None, 'a']),
+            'data': pd.to_datetime(['2023-01-01', None, '2023-01-03']),
+            'nulavel': pd.array([1, None, 3], dtype='Int64'),
+            'arrow': pd.array([None, None, 1.0], dtype='float64[pyarrow]'),
+        })
+        
+        missing = self.analyzer.analyze()['missing_values']
+        
+        assert missing == self.analyzer.data.isnull().sum().to_dict()
+    
+    def test_column_histograms(self):
+        """Testa se os histogramas compilados equivalem aos do NumPy."""
+        from main import _compiled_kernels
+        
+        _, column_histograms = _compiled_kernels()
+        
+        rng = np.random.default_rng(0)
+        normal = rng.normal(100, 25, 1000)
+        normal[::7] = np.nan
+        with_inf = np.array([1.0, 2.0, np.inf, 3.0, -np.inf] * 200)
+        constant = np.full(1000, 5.0)
+        values = np.asfortranarray(np.column_stack([normal, with_inf, constant]))
+        
+        unknown = np.full(3, np.nan)
+        
+        counts, edges = column_histograms(values, 30, unknown, unknown)
+        
+        for i in range(values.shape[1]):
+            column = values[:, i]
+            expected_counts, expected_edges = np.histogram(
+                column[np.isfinite(column)], bins=30
+            )
+            np.testing.assert_array_equal(counts[:, i], expected_counts)
+            np.testing.assert_allclose(edges[:, i], expected_edges)
+        
+        # Limites informados valem como o range= do np.histogram
+        lower, upper = np.array([50.0, 1.0, 5.0]), np.array([150.0, 2.0, 5.0])
+        counts, edges = column_histograms(values, 30, lower, upper)
+        
+        for i in range(values.shape[1]):
+            column = values[:, i]
+            bounds = (lower[i], upper[i]) if lower[i] < upper[i] else None
+            expected_counts, expected_edges = np.histogram(
+                column[np.isfinite(column)], bins=30, range=bounds
+            )
+            np.testing.assert_array_equal(counts[:, i], expected_counts)
+            np.testing.assert_allclose(edges[:, i], expected_edges)
+    
+    def test_analyze_reflects_in_place_changes(self):
+        """Testa se a análise acompanha alterações feitas diretamente nos dados."""
+        data = self.analyzer.generate_sample_data()
+        first = self.analyzer.analyze()
+        
+        data['valor'] *= 10
+        second = self.analyzer.analyze()
+        
+        assert second['numeric_summary']['valor']['mean'] == \
+            pytest.approx(10 * first['numeric_summary']['valor']['mean'], rel=1e-6)
+        
+        data.loc[data['categoria'] == 'A', 'categoria'] = 'Z'
+        counts = self.analyzer.analyze()['categorical_summary']['categoria']
+        assert 'A' not in counts
+        assert counts['Z'] == first['categorical_summary']['categoria']['A']
+    
+    def test_analyze_chunks(self, tmp_path):
+        """Testa a análise em blocos contra a análise em memória."""
+        self.analyzer.data_path = Path(__file__).parent.parent / "data" / "sample_data.csv"
+        
+        streamed = self.analyzer.analyze_chunks(chunksize=7)
+        analysis = self.analyzer.analyze()
+        
+        assert isinstance(streamed, AnalysisResult)
+        assert streamed['shape'] == analysis['shape']
+        assert streamed['columns'] == analysis['columns']
+        assert streamed['dtypes']['valor'] == 'float64'
+        assert streamed['missing_values'] == analysis['missing_values']
+        assert streamed['categorical_summary']['categoria'] == \
+            analysis['categorical_summary']['categoria']
+        for stat in ['count', 'mean', 'std', 'min', 'max']:
+            assert streamed['numeric_summary']['valor'][stat] == \
+                pytest.approx(analysis['numeric_summary']['valor'][stat])
+        assert b'"categoria"' in streamed.to_json()
+        
+        # Coluna só com ausentes e coluna com um único valor não têm desvio
+        csv_path = tmp_path / "dados.csv"
+        csv_path.write_text("a,b,c\n1,,\n2,,\n3,,4\n")
+        self.analyzer.data_path = csv_path
+        
+        summary = self.analyzer.analyze_chunks(chunksize=2).numeric_summary
+        expected = pd.read_csv(csv_path).describe()
+        
+        for col in ['a', 'b', 'c']:
+            assert summary[col]['count'] == expected[col]['count']
+            np.testing.assert_equal(summary[col]['std'], expected[col]['std'])
+    
+    def test_analyze_chunks_large_offset(self, tmp_path):
+        """Testa a precisão do desvio em blocos quando a média é muito grande."""
+        values = 1e9 + np.random.default_rng(0).normal(0, 1, 10_000)
+        csv_path = tmp_path / "dados.csv"
+        pd.DataFrame({'x': values}).to_csv(csv_path, index=False)
+        self.analyzer.data_path = csv_path
+        
+        streamed = self.analyzer.analyze_chunks(chunksize=999)
+        expected = pd.read_csv(csv_path)['x']
+        
+        assert streamed['numeric_summary']['x']['mean'] == pytest.approx(expected.mean())
+        assert streamed['numeric_summary']['x']['std'] == \
+            pytest.approx(expected.std(), rel=1e-6)
+    
+    def test_schema_refresh_on_reassignment(self):
+        """Testa se as colunas por tipo acompanham a reatribuição dos dados."""
+        self.analyzer.generate_sample_data()
+        assert self.analyzer._numeric_cols == ('id', 'valor')
+        assert self.analyzer._cat_cols == ('categoria',)
+        assert self.analyzer._bool_cols == ('ativo',)
+        
+        # As contagens do analyze() ficam disponíveis para a visualização seguinte
+        self.analyzer.analyze()
+        assert set(self.analyzer._value_counts) == {'categoria', 'ativo'}
+        
+        self.analyzer.data = pd.DataFrame({'nome': ['a', 'b']})
+        assert self.analyzer._value_counts is None
+        assert self.analyzer._numeric_cols == ()
+        assert self.analyzer._cat_cols == ('nome',)
+        assert self.analyzer.analyze()['numeric_summary'] == {}
     
     def test_analyze_empty_data(self):
         """Testa a análise com dados vazios."""
@@ -99,8 +425,68 @@ class TestDataAnalyzer:
         # Cria as visualizações
         self.analyzer.create_visualizations(str(plot_dir))
         
-        # Verifica se o diretório foi criado
+        # Verifica se o diretório e os gráficos foram criados
         assert plot_dir.exists()
+        assert (plot_dir / 'distribuicoes.png').exists()
+        assert (plot_dir / 'categoricas.png').exists()
+    
+    def test_create_visualizations_consumes_value_counts(self, tmp_path):
+        """Testa se as contagens do analyze() valem para uma única visualização."""
+        self.analyzer.generate_sample_data()
+        self.analyzer.analyze()
+        assert self.analyzer._value_counts is not None
+        
+        self.analyzer.create_visualizations(str(tmp_path / "plots"))
+        
+        assert self.analyzer._value_counts is None
+    
+    def test_create_visualizations_consumes_numeric_ranges(self, tmp_path):
+        """Testa se os histogramas usam o mínimo e o máximo do analyze() uma única vez."""
+        data = self.analyzer.generate_sample_data()
+        self.analyzer.analyze()
+        ranges = self.analyzer._numeric_ranges
+        assert ranges['valor']['min'] == data['valor'].min()
+        assert ranges['valor']['max'] == data['valor'].max()
+        
+        self.analyzer.create_visualizations(str(tmp_path / "plots"))
+        
+        assert self.analyzer._numeric_ranges is None
+    
+    def test_create_visualizations_without_numba(self, tmp_path, monkeypatch):
+        """Testa os gráficos e o resumo numérico sem os kernels do Numba."""
+        import main
+        
+        monkeypatch.setattr(main, '_kernels', ())
+        data = self.analyzer.generate_sample_data()
+        data['valor'] = data['valor'].astype(np.float64)
+        data.loc[1::10, 'valor'] = np.nan
+        
+        analysis = self.analyzer.analyze()
+        pd.testing.assert_frame_equal(analysis.numeric_summary, data.describe())
+        
+        # Infinitos são ignorados pelos histogramas, como no kernel compilado
+        data.loc[::10, 'valor'] = np.inf
+        self.analyzer.create_visualizations(str(tmp_path / "plots"))
+        assert (tmp_path / "plots" / 'distribuicoes.png').exists()
+        
+        finite = data['valor'].to_numpy()
+        counts, edges = main._finite_histogram(finite, 30)
+        expected_counts, expected_edges = np.histogram(finite[np.isfinite(finite)], bins=30)
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_array_equal(edges, expected_edges)
+    
+    def test_import_without_plotting_modules(self):
+        """Testa se importar o módulo não carrega as bibliotecas de gráficos nem o Numba."""
+        code = (
+            "import sys, main; "
+            "print(any(m in sys.modules for m in ('matplotlib', 'seaborn', 'numba')))"
+        )
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=src_dir, capture_output=True, text=True
+        )
+        
+        assert result.stdout.strip() == "False"
     
     def test_data_quality(self):
         """Testa a qualidade dos dados gerados."""
@@ -129,8 +515,8 @@ def test_main_workflow():
     # Executa a função principal
     result = main()
     
-    # Verifica se retornou um dicionário com os resultados
-    assert isinstance(result, dict)
+    # Verifica se retornou os resultados da análise
+    assert isinstance(result, AnalysisResult)
     assert 'shape' in result
     assert 'columns' in result
 